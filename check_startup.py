@@ -0,0 +1,57 @@
+import os
+import sys
+import subprocess
+
+# Batas waktu import main.py (mikrodetik), diukur dengan `python -X importtime`
+STARTUP_BUDGET_US = 150_000
+
+# Modul berat yang hanya boleh di-import saat benar-benar dipakai
+HEAVY_MODULES = ("pandas", "numpy", "sklearn", "scipy", "whoosh", "Sastrawi")
+
+
+def measure_import_time(module: str = "main"):
+    """Menjalankan `python -X importtime -c 'import <module>'` di proses baru."""
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Import {module} gagal:\n{completed.stderr}")
+
+    total_us = 0
+    imported = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not cumulative.isdigit():
+            continue
+        imported.add(name.split(".")[0])
+        if name == module:
+            total_us = int(cumulative)
+
+    return total_us, imported
+
+
+def check_startup(module: str = "main", budget_us: int = STARTUP_BUDGET_US):
+    """Cek waktu import terhadap budget dan pastikan tidak ada modul berat yang ikut ter-import."""
+    total_us, imported = measure_import_time(module)
+    heavy = sorted(set(HEAVY_MODULES) & imported)
+
+    print(f"⏱️  Import {module}: {total_us / 1000:.1f} ms (budget {budget_us / 1000:.1f} ms)")
+    if heavy:
+        print(f"❌ Modul berat ter-import saat startup: {', '.join(heavy)}")
+    if total_us > budget_us:
+        print("❌ Waktu startup melebihi budget")
+
+    ok = not heavy and total_us <= budget_us
+    if ok:
+        print("✅ Startup dalam budget")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_startup() else 1)
@@ -0,0 +1,380 @@
+import os
+import re
+import csv
+from multiprocessing import Pool, cpu_count, freeze_support
+
+HEADER_LINES = {"judul,konten", "title,content"}
+
+# Pola dikompilasi sekali saat import, bukan di setiap panggilan
+_KOMPAS_PREFIX = re.compile(
+    r'^(?:"\s*KOMPAS\.com\s*[–\-]\s*'
+    r'|KOMPAS\.com\s*[–\-]\s*'
+    r'|"\s*KOMPAS\.com\s*'
+    r'|KOMPAS\.com\s*'
+    r'|\(\s*KOMPAS\.com\s*\)\s*'
+    r'|\[\s*KOMPAS\.com\s*\]\s*)',
+    re.IGNORECASE,
+)
+_QUOTED_PAIR = re.compile(r'^"([^"]*)"\s*,\s*"([^"]*)"$')
+_QUOTED_KONTEN_SPLIT = re.compile(r',\s*"')
+_REPEATED_QUOTES = re.compile(r'"+')
+_WHITESPACE = re.compile(r'\s+')
+_ENTRY_BARE_JUDUL = re.compile(r'^[^"]+,"[^"]+')
+_ENTRY_QUOTED_JUDUL = re.compile(r'^"[^"]+","[^"]')
+_RECORD_START_BARE = re.compile(r'^[^",]+,"')
+_RECORD_START_QUOTED = re.compile(r'^"[^"]+","[^"]')
+
+# Semua sumber dibaca langsung dari dataset/ mentah:
+# - etd_ugm: record terpecah di beberapa baris, digabung lalu dinormalisasi
+#   (pengganti fix_all_formats di notebook)
+# - sumber lain: dibaca dengan csv reader dan "–" diganti "-"
+#   (pengganti clean_and_quote_csv yang menulis datasets_cleaned/)
+SOURCE_PROFILES = {
+    # etd_ugm mentah: satu record bisa terpecah di beberapa baris
+    "etd_ugm": {
+        "record_starts": (_RECORD_START_BARE, _RECORD_START_QUOTED),
+        "parser": "entry",
+        "source_prefix": _KOMPAS_PREFIX,
+        "normalize_text": True,
+        "replace_dash": False,
+        "drop_empty": True,
+    },
+    "etd_usk": {
+        "record_starts": None,
+        "parser": "csv",
+        "source_prefix": _KOMPAS_PREFIX,
+        "normalize_text": False,
+        "replace_dash": True,
+        "drop_empty": False,
+    },
+    "kompas": {
+        "record_starts": None,
+        "parser": "csv",
+        "source_prefix": _KOMPAS_PREFIX,
+        "normalize_text": False,
+        "replace_dash": True,
+        "drop_empty": False,
+    },
+    "mojok": {
+        "record_starts": None,
+        "parser": "csv",
+        "source_prefix": _KOMPAS_PREFIX,
+        "normalize_text": False,
+        "replace_dash": True,
+        "drop_empty": False,
+    },
+    "tempo": {
+        "record_starts": None,
+        "parser": "csv",
+        "source_prefix": _KOMPAS_PREFIX,
+        "normalize_text": False,
+        "replace_dash": True,
+        "drop_empty": False,
+    },
+}
+
+DEFAULT_PROFILE = SOURCE_PROFILES["etd_usk"]
+
+
+def clean_excessive_quotes(text):
+    if not text:
+        return text
+
+    text = text.strip()
+
+    while text.startswith('"""'):
+        text = text[3:]
+    while text.startswith('""'):
+        text = text[2:]
+    if text.startswith('"'):
+        text = text[1:]
+
+    while text.endswith('"""'):
+        text = text[:-3]
+    while text.endswith('""'):
+        text = text[:-2]
+    if text.endswith('"'):
+        text = text[:-1]
+
+    return text.strip()
+
+
+def clean_text(text):
+    if not text:
+        return ""
+
+    text = _REPEATED_QUOTES.sub('"', text)
+
+    text = text.strip()
+    while text.startswith('"') and text.endswith('"') and len(text) > 1:
+        text = text[1:-1].strip()
+
+    text = text.replace("–", "-")
+    text = text.replace("”", '"')
+    text = text.replace("“", '"')
+
+    text = _WHITESPACE.sub(' ', text)
+
+    return text.strip()
+
+
+def remove_source_prefix(text, pattern=_KOMPAS_PREFIX):
+    if not text:
+        return text
+
+    cleaned_text = pattern.sub('', text.strip(), count=1)
+    cleaned_text = cleaned_text.replace('""', '"')
+
+    return cleaned_text.strip()
+
+
+def parse_csv_line_robust(line):
+    line = line.strip()
+
+    # Jalur cepat: bentuk "judul","konten" tanpa kutip di dalam field
+    match = _QUOTED_PAIR.match(line)
+    if match:
+        return [clean_excessive_quotes(match.group(1)), clean_excessive_quotes(match.group(2))]
+
+    try:
+        row = next(csv.reader([line], quotechar='"', delimiter=',', skipinitialspace=True))
+        if len(row) == 2:
+            return [clean_excessive_quotes(row[0]), clean_excessive_quotes(row[1])]
+    except csv.Error:
+        pass
+
+    if line.count('"') >= 4:
+        parts = _QUOTED_KONTEN_SPLIT.split(line, 1)
+        if len(parts) == 2:
+            judul = clean_excessive_quotes(parts[0])
+            konten = clean_excessive_quotes('"' + parts[1])
+            return [judul, konten]
+
+    if ',' in line:
+        first_comma = line.find(',')
+        judul = clean_excessive_quotes(line[:first_comma].strip())
+        konten = clean_excessive_quotes(line[first_comma + 1:].strip())
+        return [judul, konten]
+
+    return None
+
+
+def parse_entry(entry):
+    entry = entry.strip()
+
+    if _ENTRY_BARE_JUDUL.match(entry):
+        first_quote = entry.find('"')
+        judul = entry[:first_quote - 1].strip() if first_quote > 0 else ""
+        konten = entry[first_quote:].strip()
+
+        if konten.startswith('"'):
+            konten = konten[1:]
+        if konten.endswith('"'):
+            konten = konten[:-1]
+
+        return [judul, konten]
+
+    if _ENTRY_QUOTED_JUDUL.match(entry):
+        parts = entry.split('","', 1)
+        if len(parts) == 2:
+            judul = parts[0][1:].strip() if parts[0].startswith('"') else parts[0].strip()
+            konten = parts[1][:-1].strip() if parts[1].endswith('"') else parts[1].strip()
+            return [judul, konten]
+
+    if entry.startswith('"""') and entry.endswith('"""') and len(entry) > 6:
+        return parse_entry(entry[3:-3])
+
+    if ',"""' in entry and entry.endswith('"""'):
+        judul, konten = entry.split(',"""', 1)
+        return [judul.strip(), konten[:-3].strip()]
+
+    return parse_csv_line_robust(entry)
+
+
+def ensure_proper_quotes(judul, konten, source_prefix=_KOMPAS_PREFIX, normalize_text=False,
+                         replace_dash=False):
+    judul = clean_excessive_quotes(judul)
+    konten = clean_excessive_quotes(konten)
+
+    if replace_dash:
+        judul = judul.replace("–", "-")
+        konten = konten.replace("–", "-")
+
+    if normalize_text:
+        judul = clean_text(judul)
+        konten = clean_text(konten)
+
+    if source_prefix is not None:
+        konten = remove_source_prefix(konten, source_prefix)
+
+    return judul.strip('"'), konten.strip('"')
+
+
+def iter_records(infile, record_starts=None, max_record_chars=1_000_000):
+    """Membaca record satu per satu tanpa memuat seluruh file.
+
+    Menghasilkan (line_num, record, oversized). Tanpa record_starts setiap
+    baris adalah satu record. Dengan record_starts, baris yang tidak cocok
+    dengan pola awal record digabung ke record sebelumnya. Record yang
+    melebihi max_record_chars dibuang sampai awal record berikutnya dan
+    dilaporkan dengan oversized=True, agar potongannya tidak terbaca
+    sebagai record baru.
+    """
+    buffer = []
+    buffer_chars = 0
+    start_line = 0
+    oversized = False
+
+    for line_num, line in enumerate(infile, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        if record_starts is None:
+            yield line_num, line, False
+            continue
+
+        starts_record = any(pattern.match(line) for pattern in record_starts)
+        if starts_record and (buffer or oversized):
+            yield start_line, ' '.join(buffer), oversized
+            buffer = []
+            buffer_chars = 0
+            oversized = False
+
+        if oversized:
+            continue
+
+        if not buffer:
+            start_line = line_num
+        buffer.append(line)
+        buffer_chars += len(line) + 1
+
+        if buffer_chars > max_record_chars:
+            buffer = [buffer[0][:100]]
+            buffer_chars = 0
+            oversized = True
+
+    if buffer or oversized:
+        yield start_line, ' '.join(buffer), oversized
+
+
+def iter_csv_records(infile, max_record_chars=1_000_000):
+    """Membaca file CSV mentah dengan csv reader, termasuk field multi-baris.
+
+    Menghasilkan (line_num, record, row). Baris yang tidak bisa dibaca atau
+    field yang melebihi max_record_chars dilaporkan dengan row=None.
+    """
+    csv.field_size_limit(max(csv.field_size_limit(), max_record_chars))
+    reader = csv.reader(infile)
+    while True:
+        line_num = reader.line_num + 1
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield line_num, str(e), None
+            continue
+        if not any(field.strip() for field in row):
+            continue
+        if sum(len(field) for field in row) > max_record_chars:
+            yield line_num, ','.join(row)[:100], None
+            continue
+        yield line_num, ','.join(row), row
+
+
+def iter_entry_records(infile, record_starts=None, max_record_chars=1_000_000):
+    """Seperti iter_csv_records, tapi record digabung per baris lalu di-parse dengan parse_entry"""
+    for line_num, record, oversized in iter_records(infile, record_starts, max_record_chars):
+        yield line_num, record, None if oversized else parse_entry(record)
+
+
+def clean_and_split_csv(input_path, output_path, profile=None, max_failed_samples=5,
+                        max_record_chars=1_000_000):
+    """Membersihkan satu file sumber secara streaming ke CSV judul,konten"""
+    profile = profile or DEFAULT_PROFILE
+
+    success_count = 0
+    fail_count = 0
+    failed_samples = []
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with open(input_path, 'r', encoding='utf-8', errors='ignore', newline='') as infile, \
+         open(output_path, 'w', encoding='utf-8', newline='') as outfile:
+
+        writer = csv.writer(outfile, quoting=csv.QUOTE_ALL)
+        writer.writerow(['judul', 'konten'])
+
+        if profile["parser"] == "entry":
+            records = iter_entry_records(infile, profile["record_starts"], max_record_chars)
+        else:
+            records = iter_csv_records(infile, max_record_chars)
+
+        for line_num, record, parsed in records:
+            if record.lower().replace('"', '') in HEADER_LINES:
+                continue
+
+            if parsed and len(parsed) == 2:
+                judul, konten = ensure_proper_quotes(
+                    *parsed, profile["source_prefix"], profile["normalize_text"],
+                    profile["replace_dash"]
+                )
+                if not profile["drop_empty"] or (judul and konten):
+                    writer.writerow([judul, konten])
+                    success_count += 1
+                    continue
+
+            fail_count += 1
+            if len(failed_samples) < max_failed_samples:
+                failed_samples.append((line_num, record[:100]))
+
+    return {
+        'input': input_path,
+        'output': output_path,
+        'success': success_count,
+        'failed': fail_count,
+        'failed_samples': failed_samples,
+    }
+
+
+def clean_source_worker(task):
+    source, input_path, output_path = task
+    return clean_and_split_csv(input_path, output_path, SOURCE_PROFILES.get(source, DEFAULT_PROFILE))
+
+
+def clean_all_sources(input_dir='dataset', output_dir='cleaned', sources=None, num_cores=None):
+    """Membersihkan semua file sumber secara paralel, satu proses per file"""
+    sources = sources or list(SOURCE_PROFILES)
+
+    tasks = []
+    for source in sources:
+        input_path = os.path.join(input_dir, f"{source}.csv")
+        if not os.path.exists(input_path):
+            print(f"❌ File tidak ditemukan: {input_path}")
+            continue
+        tasks.append((source, input_path, os.path.join(output_dir, f"{source}_cleaned.csv")))
+
+    if not tasks:
+        return []
+
+    num_cores = num_cores or max(1, min(len(tasks), cpu_count() - 1))
+    print(f"🧠 Membersihkan {len(tasks)} file dengan {num_cores} proses...")
+
+    results = []
+    with Pool(num_cores) as pool:
+        for stats in pool.imap_unordered(clean_source_worker, tasks):
+            print(f"-> ✅ {os.path.basename(stats['input'])}: "
+                  f"Berhasil {stats['success']} baris, Gagal {stats['failed']} baris")
+            for line_num, sample in stats['failed_samples']:
+                print(f"   Baris {line_num}: {sample}...")
+            results.append(stats)
+
+    return results
+
+
+if __name__ == "__main__":
+    freeze_support()
+    clean_all_sources()
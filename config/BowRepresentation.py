@@ -1,4 +1,3 @@
-from sklearn.feature_extraction.text import CountVectorizer
 from typing import List, Dict, Tuple
 class BowRepresentation:
     """Class untuk representasi Bag of Words"""
@@ -9,17 +8,19 @@ class BowRepresentation:
         self.feature_names = None
         self.is_created = False
     
-    def create_bow(self, documents: List[str]):
+    def create_bow(self, documents: List[str], verbose: bool = True):
         """Membuat representasi BoW dari dokumen"""
-        print("🔄 Creating Bag of Words representation...")
+        if verbose:
+            print("🔄 Creating Bag of Words representation...")
         
         try:
+            from sklearn.feature_extraction.text import CountVectorizer
           
             documents_clean = [str(doc) for doc in documents]
             
           
             empty_docs = [i for i, doc in enumerate(documents_clean) if not doc.strip()]
-            if empty_docs:
+            if verbose and empty_docs:
                 print(f"⚠️  Ditemukan {len(empty_docs)} dokumen kosong, akan diabaikan")
             
           
@@ -27,11 +28,13 @@ class BowRepresentation:
                 lowercase=False 
             )
             
-            print("📊 Membuat vocabulary dan matrix...")
+            if verbose:
+                print("📊 Membuat vocabulary dan matrix...")
             self.bow_matrix = self.vectorizer.fit_transform(documents_clean)
             self.feature_names = self.vectorizer.get_feature_names_out()
             
-            print(f"✅ BoW created: {self.bow_matrix.shape[0]} docs, {self.bow_matrix.shape[1]} terms")
+            if verbose:
+                print(f"✅ BoW created: {self.bow_matrix.shape[0]} docs, {self.bow_matrix.shape[1]} terms")
             self.is_created = True
             return self.bow_matrix
         except Exception as e:
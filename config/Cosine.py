@@ -1,10 +1,8 @@
-import pandas as pd
-from typing import List, Dict
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import List, Dict, TYPE_CHECKING
 from config.BowRepresentation import BowRepresentation
-import pandas as pd
-import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class CosineRanker:
     
@@ -12,15 +10,18 @@ class CosineRanker:
         self.bow_model = None
         self.df = None
         self.doc_vectors = None
+        self.doc_index = {}
         self.is_initialized = False
     
-    def initialize(self, bow_model: BowRepresentation, df: pd.DataFrame):
+    def initialize(self, bow_model: BowRepresentation, df: "pd.DataFrame", verbose: bool = True):
         """Initialize cosine ranker dengan bow model dan data"""
         self.bow_model = bow_model
         self.df = df
         self.doc_vectors = bow_model.bow_matrix
+        self.doc_index = {doc_id: idx for idx, doc_id in enumerate(df['doc_id'])}
         self.is_initialized = True
-        print("✅ Cosine Ranker initialized")
+        if verbose:
+            print("✅ Cosine Ranker initialized")
     
     def rank_documents(self, query: str, top_k: int = 5) -> List[Dict]:
         """Ranking dokumen berdasarkan cosine similarity dengan query"""
@@ -28,6 +29,9 @@ class CosineRanker:
             raise ValueError("CosineRanker belum diinisialisasi. Panggil initialize() terlebih dahulu.")
         
         try:
+            import numpy as np
+            from sklearn.metrics.pairwise import cosine_similarity
+            
             query_vector = self.bow_model.get_query_vector(query)
             
             similarities = cosine_similarity(query_vector, self.doc_vectors)
@@ -63,18 +67,19 @@ class CosineRanker:
             raise ValueError("CosineRanker belum diinisialisasi. Panggil initialize() terlebih dahulu.")
         
         try:
+            from sklearn.metrics.pairwise import cosine_similarity
+            
             if not whoosh_results:
                 print("⚠️ Whoosh tidak menemukan hasil")
                 return []
             
           
-            whoosh_doc_ids = [int(r['doc_id']) for r in whoosh_results]
+            whoosh_scores = {int(r['doc_id']): r['score'] for r in whoosh_results}
             
            
-            whoosh_indices = []
-            for idx, doc_id in enumerate(self.df['doc_id']):
-                if doc_id in whoosh_doc_ids:
-                    whoosh_indices.append(idx)
+            whoosh_indices = sorted(
+                self.doc_index[doc_id] for doc_id in whoosh_scores if doc_id in self.doc_index
+            )
             
             if not whoosh_indices:
                 print("⚠️ Tidak ada dokumen yang cocok untuk hybrid search")
@@ -91,12 +96,7 @@ class CosineRanker:
             combined_results = []
             for i, idx in enumerate(whoosh_indices):
                 doc_id = self.df.iloc[idx]['doc_id']
-                # Cari whoosh score dari results
-                whoosh_score = 0
-                for result in whoosh_results:
-                    if result['doc_id'] == str(doc_id):
-                        whoosh_score = result['score']
-                        break
+                whoosh_score = whoosh_scores.get(int(doc_id), 0)
                 
                 cosine_score = similarity_scores[i]
                 
@@ -1,5 +1,4 @@
 import os
-import pandas as pd
 class DataLoader:
     """Class untuk memuat dan mempersiapkan data"""
     
@@ -17,32 +16,37 @@ class DataLoader:
         if current == total:
             print()
     
-    def load_processed_data(self, file_path: str = r"step_data\step6_detokenized.csv"):
-        """Muat data hasil stemming yang sudah di-detokenized"""
+    def load_processed_data(self, file_path: str = r"step_data\step6_detokenized.csv", verbose: bool = True):
+        """Muat data hasil stemming yang sudah di-detokenized (verbose=False hanya mencetak error)"""
         try:
+            import pandas as pd
+            
             if not os.path.exists(file_path):
                 print(f"❌ File tidak ditemukan di path: {file_path}")
                 return None
 
-            print(f"📂 Membaca file: {file_path}")
+            if verbose:
+                print(f"📂 Membaca file: {file_path}")
             self.df = pd.read_csv(file_path)
-            print(f"✅ Data loaded: {len(self.df):,} baris")
-            
-            print("\n🔍 Preview 2 baris teratas:")
-            print(self.df.head(2))
-            print("\n📑 Kolom yang terbaca:", list(self.df.columns))
+            if verbose:
+                print(f"✅ Data loaded: {len(self.df):,} baris")
+                
+                print("\n🔍 Preview 2 baris teratas:")
+                print(self.df.head(2))
+                print("\n📑 Kolom yang terbaca:", list(self.df.columns))
 
-            # Bersihkan data dari NaN values
-            print("🧹 Membersihkan data dari NaN values...")
+                # Bersihkan data dari NaN values
+                print("🧹 Membersihkan data dari NaN values...")
             initial_count = len(self.df)
             self.df = self.df.dropna(subset=['judul', 'konten'])
             cleaned_count = len(self.df)
             
-            if initial_count > cleaned_count:
+            if verbose and initial_count > cleaned_count:
                 print(f"   - Dihapus {initial_count - cleaned_count} baris dengan nilai NaN")
             
             # Untuk data yang sudah di-detokenized, langsung gunakan sebagai text
-            print("🔄 Memproses teks...")
+            if verbose:
+                print("🔄 Memproses teks...")
             total_rows = len(self.df)
             
             # Process dengan progress bar
@@ -51,7 +55,8 @@ class DataLoader:
             full_texts = []
             
             for i, (idx, row) in enumerate(self.df.iterrows()):
-                self.show_progress(i + 1, total_rows, "🔄 Memproses dokumen", f"{i+1}/{total_rows}")
+                if verbose:
+                    self.show_progress(i + 1, total_rows, "🔄 Memproses dokumen", f"{i+1}/{total_rows}")
                 
                 judul_text = str(row['judul'])
                 konten_text = str(row['konten'])
@@ -67,24 +72,27 @@ class DataLoader:
 
             # Tambahkan doc_id jika belum ada
             if 'doc_id' not in self.df.columns:
-                print("🔢 Menambahkan doc_id...")
+                if verbose:
+                    print("🔢 Menambahkan doc_id...")
                 self.df['doc_id'] = range(1, len(self.df) + 1)
 
             # Summary dataset
-            if 'dataset' in self.df.columns:
+            if 'dataset' not in self.df.columns:
+                # Jika tidak ada kolom dataset, tambahkan default
+                self.df['dataset'] = 'merged_data'
+                if verbose:
+                    print(f"   - Dataset: {len(self.df)} dokumen (merged)")
+            elif verbose:
                 print("\n📊 Dataset Summary:")
                 for dataset in self.df['dataset'].unique():
                     count = len(self.df[self.df['dataset'] == dataset])
                     print(f"   - {dataset}: {count} dokumen")
-            else:
-                # Jika tidak ada kolom dataset, tambahkan default
-                self.df['dataset'] = 'merged_data'
-                print(f"   - Dataset: {len(self.df)} dokumen (merged)")
 
-            print(f"\n✅ Data siap digunakan:")
-            print(f"   - Total dokumen: {len(self.df):,}")
-            print(f"   - Sample judul: {self.df.iloc[0]['judul_text'][:100]}...")
-            print(f"   - Sample konten: {self.df.iloc[0]['konten_text'][:100]}...")
+            if verbose:
+                print(f"\n✅ Data siap digunakan:")
+                print(f"   - Total dokumen: {len(self.df):,}")
+                print(f"   - Sample judul: {self.df.iloc[0]['judul_text'][:100]}...")
+                print(f"   - Sample konten: {self.df.iloc[0]['konten_text'][:100]}...")
             
             self.is_loaded = True
             return self.df
@@ -0,0 +1,161 @@
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+
+class IndexSnapshot:
+    """Snapshot index yang immutable: data, BoW, Whoosh index dan doc_id map satu versi"""
+
+    def __init__(self, version: int, df, bow_model, indexer, cosine_ranker, query_corrector=None):
+        object.__setattr__(self, '_refs', 0)
+        object.__setattr__(self, '_retired', False)
+        object.__setattr__(self, '_closed', False)
+        object.__setattr__(self, '_ref_lock', threading.Lock())
+
+        self._set('version', version)
+        self._set('df', df)
+        self._set('bow_model', bow_model)
+        self._set('indexer', indexer)
+        self._set('cosine_ranker', cosine_ranker)
+        self._set('query_corrector', query_corrector)
+        self._set('doc_id_map', cosine_ranker.doc_index)
+
+        # Matrix dibagi antar thread pembaca, jadi dikunci dari penulisan
+        matrix = bow_model.bow_matrix
+        for array in (matrix.data, matrix.indices, matrix.indptr):
+            array.flags.writeable = False
+
+    def _set(self, name, value):
+        object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"IndexSnapshot v{self.version} immutable, tidak bisa mengubah '{name}'")
+
+    @property
+    def vocabulary(self):
+        return self.bow_model.vectorizer.vocabulary_
+
+    @property
+    def matrix(self):
+        return self.bow_model.bow_matrix
+
+    def acquire(self):
+        """Tambah referensi pembaca"""
+        with self._ref_lock:
+            if self._closed:
+                raise ValueError(f"IndexSnapshot v{self.version} sudah ditutup")
+            object.__setattr__(self, '_refs', self._refs + 1)
+        return self
+
+    def release(self):
+        """Lepas referensi pembaca, tutup jika snapshot sudah diganti"""
+        with self._ref_lock:
+            object.__setattr__(self, '_refs', self._refs - 1)
+            should_close = self._retired and self._refs == 0
+        if should_close:
+            self._close()
+
+    def retire(self):
+        """Tandai snapshot sudah diganti, ditutup setelah pembaca terakhir selesai"""
+        with self._ref_lock:
+            object.__setattr__(self, '_retired', True)
+            should_close = self._refs == 0
+        if should_close:
+            self._close()
+
+    def _close(self):
+        with self._ref_lock:
+            if self._closed:
+                return
+            object.__setattr__(self, '_closed', True)
+
+        self.indexer.close()
+        shutil.rmtree(self.indexer.index_dir, ignore_errors=True)
+
+
+class SnapshotManager:
+    """Menyimpan snapshot aktif dan menukarnya secara atomic saat reload"""
+
+    def __init__(self, index_root: str = "whoosh_index"):
+        self.index_root = index_root
+        self._index_dirs = []
+        self._current = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self._build_thread = None
+
+    @property
+    def current(self):
+        return self._current
+
+    @property
+    def is_building(self):
+        return self._build_thread is not None and self._build_thread.is_alive()
+
+    def next_version(self) -> int:
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def create_index_dir(self, version: int) -> str:
+        """Buat folder index unik untuk proses ini.
+
+        Nomor versi mulai dari 1 di tiap proses, jadi nama folder diberi
+        akhiran acak agar proses lain (mis. build headless) tidak menimpanya.
+        """
+        os.makedirs(self.index_root, exist_ok=True)
+        index_dir = tempfile.mkdtemp(dir=self.index_root, prefix=f"v{version}-{os.getpid()}-")
+        with self._lock:
+            self._index_dirs.append(index_dir)
+        return index_dir
+
+    @contextmanager
+    def acquire(self):
+        """Pinjam snapshot aktif; tetap valid walau ada swap selama dipakai"""
+        with self._lock:
+            snapshot = self._current
+            if snapshot is None:
+                raise ValueError("Belum ada snapshot. Load dataset terlebih dahulu (Menu 1).")
+            snapshot.acquire()
+        try:
+            yield snapshot
+        finally:
+            snapshot.release()
+
+    def publish(self, snapshot: IndexSnapshot):
+        """Ganti snapshot aktif secara atomic, snapshot lama dibersihkan setelah tidak dipakai"""
+        with self._lock:
+            old, self._current = self._current, snapshot
+        if old is not None:
+            old.retire()
+        return old
+
+    def build_in_background(self, builder, *args):
+        """Jalankan builder(*args) di thread terpisah lalu publish hasilnya"""
+        if self.is_building:
+            raise ValueError("Rebuild index sedang berjalan")
+
+        def run():
+            snapshot = builder(*args)
+            if snapshot is not None:
+                self.publish(snapshot)
+                print(f"\n✅ Snapshot v{snapshot.version} aktif")
+
+        self._build_thread = threading.Thread(target=run, name="snapshot-builder", daemon=True)
+        self._build_thread.start()
+        return self._build_thread
+
+    def close(self):
+        """Tunggu build yang berjalan, tutup snapshot aktif lalu hapus folder index milik proses ini"""
+        if self._build_thread is not None:
+            self._build_thread.join()
+        with self._lock:
+            old, self._current = self._current, None
+            index_dirs, self._index_dirs = self._index_dirs, []
+        if old is not None:
+            old.retire()
+        # Sisa build yang gagal; folder proses lain tidak disentuh
+        for index_dir in index_dirs:
+            shutil.rmtree(index_dir, ignore_errors=True)
@@ -0,0 +1,249 @@
+import os
+import re
+import hashlib
+import string
+import pickle
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional
+from config.BowRepresentation import BowRepresentation
+
+_stemmer = None
+_stopwords = None
+
+_DIGITS = re.compile(r'\d+')
+_PUNCTUATION = str.maketrans('', '', string.punctuation)
+# Kata biasa di query; kata yang menempel ke sintaks Whoosh (field:, wildcard,
+# fuzzy~, boost^, angka) tidak cocok dan dibiarkan apa adanya
+_QUERY_WORD = re.compile(r'(?<![\w:*?~^])[^\W\d_]+(?![\w:*?~^])')
+_QUERY_OPERATORS = {"AND", "OR", "NOT", "TO"}
+
+
+def init_normalizer():
+    """Siapkan stemmer & stopword Sastrawi (sekali per proses)"""
+    global _stemmer, _stopwords
+    if _stemmer is None:
+        from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+        from Sastrawi.StopWordRemover.StopWordRemoverFactory import StopWordRemoverFactory
+        _stemmer = StemmerFactory().create_stemmer()
+        _stopwords = set(StopWordRemoverFactory().get_stop_words())
+
+
+@lru_cache(maxsize=100_000)
+def stem_word(word: str) -> str:
+    """Stem satu kata dengan cache, karena kata query sangat berulang"""
+    init_normalizer()
+    return _stemmer.stem(word)
+
+
+def normalize_word(word: str) -> Optional[str]:
+    """Casefold → cleaning → stopword → stemming satu kata, sama seperti korpus"""
+    init_normalizer()
+    token = _DIGITS.sub('', word.lower()).translate(_PUNCTUATION)
+    if not token or token in _stopwords:
+        return None
+    return stem_word(token)
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Damerau-Levenshtein (OSA), berhenti lebih awal jika > max_distance"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and j > 1 and a[i - 1] == b[j - 2]
+                    and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+            row_min = min(row_min, current[j])
+        if row_min > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class QueryCorrector:
+    """Koreksi ejaan query dengan indeks symmetric-delete (SymSpell) dari vocabulary BoW"""
+
+    def __init__(self, max_edit_distance: int = 2, prefix_length: int = 7):
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.vocabulary = None
+        self.doc_freqs = None
+        self.deletes = None
+        self.fingerprint = None
+        self.feature_names = None
+        self.is_built = False
+
+    @staticmethod
+    def bow_fingerprint(bow_model: BowRepresentation) -> Tuple[int, int, int, str]:
+        """Penanda untuk memastikan indeks cocok dengan BoW yang dimuat.
+
+        Indeks menyimpan nomor term, jadi urutan vocabulary ikut di-hash:
+        dataset lain dengan shape/nnz sama tidak boleh memakai indeks ini.
+        """
+        vocabulary_hash = hashlib.sha1("\n".join(bow_model.feature_names).encode("utf-8")).hexdigest()
+        return bow_model.bow_matrix.shape + (bow_model.bow_matrix.nnz, vocabulary_hash)
+
+    def max_distance_for(self, term: str) -> int:
+        """Jarak edit yang diizinkan menurut panjang kata.
+
+        Kata pendek (sering singkatan seperti 'bni') terlalu dekat dengan
+        kata lain, jadi tidak dikoreksi atau hanya dengan jarak 1.
+        """
+        if len(term) <= 3:
+            return 0
+        if len(term) <= 5:
+            return min(1, self.max_edit_distance)
+        return self.max_edit_distance
+
+    def _deletes_of(self, word: str, max_distance: int = None):
+        """Semua variasi hapus karakter dari prefix kata, hingga max_distance"""
+        if max_distance is None:
+            max_distance = self.max_edit_distance
+        prefix = word[:self.prefix_length]
+        results = {prefix}
+        frontier = {prefix}
+        for _ in range(max_distance):
+            next_frontier = set()
+            for candidate in frontier:
+                if len(candidate) <= 1:
+                    continue
+                for i in range(len(candidate)):
+                    deleted = candidate[:i] + candidate[i + 1:]
+                    if deleted not in results:
+                        next_frontier.add(deleted)
+            results |= next_frontier
+            frontier = next_frontier
+        return results
+
+    def build(self, bow_model: BowRepresentation, verbose: bool = True):
+        """Bangun indeks delete dari vocabulary_ dan document frequency BoW"""
+        if not bow_model.is_created:
+            raise ValueError("BoW belum dibuat. Panggil create_bow() terlebih dahulu.")
+
+        import numpy as np
+        
+        if verbose:
+            print("🔄 Membangun indeks koreksi query...")
+        self.vocabulary = bow_model.vectorizer.vocabulary_
+        self.feature_names = bow_model.feature_names
+        matrix = bow_model.bow_matrix.tocsc()
+        self.doc_freqs = np.diff(matrix.indptr)
+
+        self.deletes = {}
+        for term, term_idx in self.vocabulary.items():
+            for deleted in self._deletes_of(term):
+                self.deletes.setdefault(deleted, []).append(term_idx)
+
+        self.fingerprint = self.bow_fingerprint(bow_model)
+        self.is_built = True
+        if verbose:
+            print(f"✅ Query corrector built: {len(self.vocabulary):,} terms, {len(self.deletes):,} deletes")
+        return self
+
+    def save(self, file_path: str):
+        """Simpan indeks agar tidak perlu dibangun ulang"""
+        with open(file_path, 'wb') as f:
+            pickle.dump({
+                'max_edit_distance': self.max_edit_distance,
+                'prefix_length': self.prefix_length,
+                'doc_freqs': self.doc_freqs,
+                'deletes': self.deletes,
+                'fingerprint': self.fingerprint,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self, file_path: str, bow_model: BowRepresentation, verbose: bool = True) -> bool:
+        """Muat indeks tersimpan jika masih cocok dengan BoW saat ini"""
+        if not os.path.exists(file_path):
+            return False
+        try:
+            with open(file_path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Indeks koreksi query tidak bisa dibaca: {e}")
+            return False
+
+        if state['fingerprint'] != self.bow_fingerprint(bow_model):
+            return False
+
+        self.max_edit_distance = state['max_edit_distance']
+        self.prefix_length = state['prefix_length']
+        self.doc_freqs = state['doc_freqs']
+        self.deletes = state['deletes']
+        self.fingerprint = state['fingerprint']
+        self.vocabulary = bow_model.vectorizer.vocabulary_
+        self.feature_names = bow_model.feature_names
+        self.is_built = True
+        if verbose:
+            print(f"✅ Query corrector loaded: {file_path}")
+        return True
+
+    def build_or_load(self, bow_model: BowRepresentation, file_path: str, verbose: bool = True):
+        """Pakai indeks tersimpan bila valid, jika tidak bangun dan simpan"""
+        if self.load(file_path, bow_model, verbose):
+            return self
+        self.build(bow_model, verbose)
+        try:
+            self.save(file_path)
+        except OSError as e:
+            print(f"⚠️ Gagal menyimpan indeks koreksi query: {e}")
+        return self
+
+    def lookup(self, term: str, max_suggestions: int = 1) -> List[Tuple[str, int, int]]:
+        """Kandidat (term, jarak, df) terdekat untuk satu kata, urut jarak lalu df"""
+        if not self.is_built:
+            raise ValueError("QueryCorrector belum dibuat. Panggil build() terlebih dahulu.")
+
+        if term in self.vocabulary:
+            return [(term, 0, int(self.doc_freqs[self.vocabulary[term]]))]
+
+        max_distance = self.max_distance_for(term)
+        if max_distance == 0:
+            return []
+
+        seen = set()
+        suggestions = []
+        for deleted in self._deletes_of(term, max_distance):
+            for term_idx in self.deletes.get(deleted, ()):
+                if term_idx in seen:
+                    continue
+                seen.add(term_idx)
+                candidate = self.feature_names[term_idx]
+                distance = edit_distance(term, candidate, max_distance)
+                if distance <= max_distance:
+                    suggestions.append((candidate, distance, int(self.doc_freqs[term_idx])))
+
+        suggestions.sort(key=lambda s: (s[1], -s[2]))
+        return suggestions[:max_suggestions]
+
+    def correct_query(self, query: str) -> Tuple[str, List[Dict]]:
+        """Ganti kata query yang tidak ada di vocabulary dengan term terdekat.
+
+        Hanya kata yang dikoreksi yang diganti; sisa query (huruf besar,
+        frasa "...", operator, field:, wildcard) tetap seperti yang diketik
+        agar sintaks Whoosh tidak rusak.
+        """
+        corrections = []
+
+        def replace(match):
+            word = match.group(0)
+            if word in _QUERY_OPERATORS:
+                return word
+            token = normalize_word(word)
+            if token is None:
+                return word
+            suggestions = self.lookup(token)
+            if not suggestions or suggestions[0][1] == 0:
+                return word
+            best, distance, _ = suggestions[0]
+            corrections.append({'term': word, 'correction': best, 'distance': distance})
+            return best
+
+        corrected = _QUERY_WORD.sub(replace, query)
+        return (corrected if corrections else query), corrections
@@ -1,8 +1,12 @@
-import whoosh.index as index
-from whoosh import fields, index, qparser, scoring
-from whoosh.analysis import StandardAnalyzer
 import os
-import pandas as pd
+import queue
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 class WhooshIndexer:
     """Class untuk indexing dengan Whoosh - FIXED VERSION"""
     
@@ -11,6 +15,10 @@ class WhooshIndexer:
         self.schema = None
         self.ix = None
         self.is_built = False
+        self._parser = None
+        self._generation = None
+        self._searcher_pool = queue.LifoQueue()
+        self._pool_lock = threading.Lock()
     
     def show_progress(self, current, total, prefix="", suffix="", length=50):
         """Menampilkan progress bar"""
@@ -24,11 +32,14 @@ class WhooshIndexer:
     
     def create_schema(self):
         """Membuat schema untuk index Whoosh"""
+        from whoosh import fields
+        from whoosh.analysis import StandardAnalyzer
+        
         # Gunakan StandardAnalyzer
         analyzer = StandardAnalyzer()
         
         self.schema = fields.Schema(
-            doc_id=fields.ID(stored=True, unique=True),
+            doc_id=fields.ID(stored=True, unique=True, sortable=True),
             judul=fields.TEXT(stored=True, analyzer=analyzer),
             konten=fields.TEXT(stored=True, analyzer=analyzer),
             full_text=fields.TEXT(stored=True, analyzer=analyzer),
@@ -36,25 +47,29 @@ class WhooshIndexer:
         )
         return self.schema
     
-    def build_index(self, df: pd.DataFrame):
+    def build_index(self, df: "pd.DataFrame", verbose: bool = True):
         """Membangun index dari dataframe"""
-        print("🔄 Building Whoosh index...")
+        if verbose:
+            print("🔄 Building Whoosh index...")
         
         try:
-            if not os.path.exists(self.index_dir):
-                os.mkdir(self.index_dir)
+            from whoosh import index
+            
+            os.makedirs(self.index_dir, exist_ok=True)
             
 
             self.create_schema()
             
+            self.close()
             self.ix = index.create_in(self.index_dir, self.schema)
             
             writer = self.ix.writer()
             total_docs = len(df)
             
-            print("📝 Mengindex dokumen...")
+            if verbose:
+                print("📝 Mengindex dokumen...")
             for idx, row in df.iterrows():
-                if idx % 1000 == 0 or idx == total_docs - 1:
+                if verbose and (idx % 1000 == 0 or idx == total_docs - 1):
                     self.show_progress(idx + 1, total_docs, "📝 Mengindex", f"{idx+1}/{total_docs}")
                 
                 writer.add_document(
@@ -65,9 +80,12 @@ class WhooshIndexer:
                     dataset=row['dataset']
                 )
             
-            print("\n💾 Menyimpan index...")
+            if verbose:
+                print("\n💾 Menyimpan index...")
             writer.commit()
-            print(f"✅ Whoosh index built: {self.ix.doc_count()} documents")
+            if verbose:
+                print(f"✅ Whoosh index built: {self.ix.doc_count()} documents")
+            self._reset_search_state()
             self.is_built = True
             return self.ix
         except Exception as e:
@@ -76,30 +94,85 @@ class WhooshIndexer:
             traceback.print_exc()
             return None
     
+    def _reset_search_state(self):
+        """Siapkan parser dan pool searcher untuk generasi index saat ini"""
+        from whoosh import qparser
+        
+        self._close_pooled_searchers()
+        with self._pool_lock:
+            self._parser = qparser.MultifieldParser(["judul", "konten", "full_text"], self.ix.schema)
+            self._generation = self.ix.latest_generation()
+    
+    def _close_pooled_searchers(self):
+        """Tutup semua searcher yang sedang menganggur di pool"""
+        while True:
+            try:
+                searcher = self._searcher_pool.get_nowait()
+            except queue.Empty:
+                break
+            searcher.close()
+    
+    def refresh(self):
+        """Baca ulang generasi index setelah index diubah dari luar build_index()"""
+        if self.ix is None:
+            raise ValueError("Index belum dibuat. Panggil build_index() terlebih dahulu.")
+        if self._parser is None or self.ix.latest_generation() != self._generation:
+            self._reset_search_state()
+    
+    @contextmanager
+    def _pooled_searcher(self):
+        """Pinjam searcher dari pool tanpa membaca folder index.
+        
+        Generasi disimpan saat build_index(); index tidak berubah setelahnya,
+        jadi folder hanya dibaca ulang lewat refresh().
+        """
+        if self._parser is None:
+            self._reset_search_state()
+        
+        try:
+            searcher = self._searcher_pool.get_nowait()
+        except queue.Empty:
+            searcher = self.ix.searcher()
+        
+        if searcher.reader().generation() != self._generation:
+            searcher = searcher.refresh()
+        
+        try:
+            yield searcher
+        finally:
+            if searcher.reader().generation() == self._generation:
+                self._searcher_pool.put(searcher)
+            else:
+                searcher.close()
+    
+    def close(self):
+        """Tutup searcher yang masih terbuka sebelum index dibuang/dibangun ulang"""
+        self._close_pooled_searchers()
+        with self._pool_lock:
+            self._parser = None
+            self._generation = None
+    
     def search(self, query: str, limit: int = 10):
-        """Search dengan Whoosh - FIXED VERSION"""
+        """Search dengan Whoosh, hanya mengembalikan docnum, doc_id dan score"""
         if self.ix is None:
             raise ValueError("Index belum dibuat. Panggil build_index() terlebih dahulu.")
         
         try:
-            with self.ix.searcher() as searcher:
-               
-                query_parser = qparser.MultifieldParser(["judul", "konten", "full_text"], self.ix.schema)
-                parsed_query = query_parser.parse(query)
-                
-               
+            with self._pooled_searcher() as searcher:
+                parsed_query = self._parser.parse(query)
                 results = searcher.search(parsed_query, limit=limit)
                 
-               
+                # doc_id dibaca dari kolom agar stored fields lain tidak ikut di-decode
+                reader = searcher.reader()
+                doc_ids = reader.column_reader('doc_id') if reader.has_column('doc_id') else None
+                
                 results_list = []
-                for result in results:
+                for hit in results:
+                    doc_id = doc_ids[hit.docnum] if doc_ids is not None else hit['doc_id']
                     results_list.append({
-                        'doc_id': result['doc_id'],
-                        'judul': result['judul'],
-                        'konten': result['konten'],
-                        'full_text': result['full_text'],
-                        'dataset': result['dataset'],
-                        'score': result.score
+                        'docnum': hit.docnum,
+                        'doc_id': doc_id,
+                        'score': hit.score
                     })
                 
                 return results_list
@@ -107,4 +180,23 @@ class WhooshIndexer:
             print(f"❌ Error in Whoosh search: {e}")
             import traceback
             traceback.print_exc()
-            return []
\ No newline at end of file
+            return []
+    
+    def fetch_documents(self, hits):
+        """Lengkapi hasil search() dengan stored fields, hanya untuk hasil yang ditampilkan"""
+        if self.ix is None:
+            raise ValueError("Index belum dibuat. Panggil build_index() terlebih dahulu.")
+        
+        with self._pooled_searcher() as searcher:
+            documents = []
+            for hit in hits:
+                stored = searcher.stored_fields(hit['docnum'])
+                documents.append({
+                    'doc_id': hit['doc_id'],
+                    'judul': stored.get('judul', ''),
+                    'konten': stored.get('konten', ''),
+                    'full_text': stored.get('full_text', ''),
+                    'dataset': stored.get('dataset', ''),
+                    'score': hit['score']
+                })
+            return documents
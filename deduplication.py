@@ -0,0 +1,251 @@
+import os
+import re
+import zlib
+import numpy as np
+import pandas as pd
+from multiprocessing import Pool, cpu_count, freeze_support
+from tqdm import tqdm
+
+NUM_PERM = 128
+NUM_BANDS = 16
+SHINGLE_SIZE = 5
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+_perm_a = None
+_perm_b = None
+
+
+def init_permutations(seed: int = 42):
+    global _perm_a, _perm_b
+    rng = np.random.RandomState(seed)
+    _perm_a = rng.randint(1, MAX_HASH, size=NUM_PERM, dtype=np.uint64)
+    _perm_b = rng.randint(0, MAX_HASH, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text: str):
+    """Word shingles dari teks yang sudah di-casefold."""
+    if not isinstance(text, str):
+        return set()
+
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if not tokens:
+        return set()
+    if len(tokens) < SHINGLE_SIZE:
+        return {" ".join(tokens)}
+    return {
+        " ".join(tokens[i:i + SHINGLE_SIZE])
+        for i in range(len(tokens) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash_signature(text: str):
+    """MinHash signature (NUM_PERM nilai) atau None untuk dokumen kosong."""
+    doc_shingles = shingles(text)
+    if not doc_shingles:
+        return None
+
+    hashes = np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in doc_shingles),
+        dtype=np.uint64,
+        count=len(doc_shingles),
+    )
+    # a, h < 2^32 sehingga a*h + b tidak overflow uint64
+    permuted = (np.outer(hashes, _perm_a) + _perm_b) % MERSENNE_PRIME
+    return (permuted & MAX_HASH).min(axis=0).astype(np.uint32)
+
+
+def signature_worker(chunk):
+    """Menghitung signature untuk satu chunk (start_row, texts)."""
+    start_row, texts = chunk
+    signatures = np.full((len(texts), NUM_PERM), MAX_HASH, dtype=np.uint32)
+    valid = np.zeros(len(texts), dtype=bool)
+    for i, text in enumerate(texts):
+        signature = minhash_signature(text)
+        if signature is not None:
+            signatures[i] = signature
+            valid[i] = True
+    return start_row, signatures, valid
+
+
+def iter_text_chunks(input_file: str, chunk_size: int):
+    """Membaca judul + konten per chunk agar memori tetap terbatas."""
+    start_row = 0
+    for df_chunk in pd.read_csv(input_file, chunksize=chunk_size, encoding="utf-8"):
+        texts = (
+            df_chunk["judul"].fillna("").astype(str)
+            + " "
+            + df_chunk["konten"].fillna("").astype(str)
+        ).tolist()
+        yield start_row, texts
+        start_row += len(texts)
+
+
+def compute_signatures(input_file: str, total_rows: int, chunk_size: int, num_cores: int):
+    """Menghitung MinHash signature semua dokumen secara paralel per chunk."""
+    signatures = np.full((total_rows, NUM_PERM), MAX_HASH, dtype=np.uint32)
+    valid = np.zeros(total_rows, dtype=bool)
+
+    with Pool(num_cores, initializer=init_permutations) as pool:
+        results = pool.imap_unordered(signature_worker, iter_text_chunks(input_file, chunk_size))
+        for start_row, chunk_signatures, chunk_valid in tqdm(
+            results,
+            total=-(-total_rows // chunk_size),
+            desc="🔐 MinHash signature",
+            ncols=100,
+        ):
+            end_row = start_row + len(chunk_signatures)
+            signatures[start_row:end_row] = chunk_signatures
+            valid[start_row:end_row] = chunk_valid
+
+    return signatures, valid
+
+
+def find_root(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def lsh_clusters(signatures, valid, threshold: float):
+    """LSH banding + verifikasi estimasi Jaccard, hasil berupa cluster duplikat."""
+    rows_per_band = NUM_PERM // NUM_BANDS
+    parent = np.arange(len(signatures))
+    candidates = np.flatnonzero(valid)
+
+    for band in tqdm(range(NUM_BANDS), desc="🪣 LSH banding", ncols=100):
+        band_slice = signatures[:, band * rows_per_band:(band + 1) * rows_per_band]
+        buckets = {}
+        for row in candidates:
+            buckets.setdefault(band_slice[row].tobytes(), []).append(row)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for i, row in enumerate(members):
+                for other in members[:i]:
+                    root_row, root_other = find_root(parent, row), find_root(parent, other)
+                    if root_row == root_other:
+                        continue
+                    similarity = np.mean(signatures[row] == signatures[other])
+                    if similarity >= threshold:
+                        parent[max(root_row, root_other)] = min(root_row, root_other)
+                        break
+
+    clusters = {}
+    for row in candidates:
+        root = find_root(parent, row)
+        clusters.setdefault(root, []).append(row)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def split_by_leader(members, signatures, threshold: float, pick_leader):
+    """Pecah komponen LSH menjadi cluster bintang di sekitar dokumen yang disimpan.
+
+    Komponen dari union-find bisa terbentuk lewat rantai (A~B~C) walau A dan C
+    tidak mirip, jadi hanya anggota yang mirip langsung dengan leader yang
+    masuk cluster-nya. Sisanya diproses ulang dengan leader baru.
+    """
+    remaining = sorted(members)
+    clusters = []
+    while remaining:
+        kept = pick_leader(remaining)
+        similarities = np.mean(signatures[remaining] == signatures[kept], axis=1)
+        cluster = [row for row, sim in zip(remaining, similarities) if row == kept or sim >= threshold]
+        if len(cluster) > 1:
+            clusters.append((kept, cluster))
+        in_cluster = set(cluster)
+        remaining = [row for row in remaining if row not in in_cluster]
+    return clusters
+
+
+def step0_deduplication(
+    input_file="merge_datasets/cleandataset.csv",
+    output_file="merge_datasets/cleandataset_dedup.csv",
+    report_file="merge_datasets/duplicate_clusters.csv",
+    threshold=0.8,
+    keep="longest",
+    chunk_size=5000,
+):
+    """Menghapus near-duplicate (MinHash/LSH) sebelum Step 1 preprocessing.
+
+    keep="longest" menyimpan dokumen terpanjang di tiap cluster,
+    keep="first" menyimpan dokumen yang muncul paling awal.
+    """
+    if keep not in ("longest", "first"):
+        raise ValueError("keep harus 'longest' atau 'first'")
+
+    if not os.path.exists(input_file):
+        print(f"❌ File {input_file} tidak ditemukan.")
+        return
+
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    num_cores = max(1, cpu_count() - 1)
+
+    lengths = []
+    datasets = []
+    for df_chunk in pd.read_csv(input_file, chunksize=chunk_size, encoding="utf-8"):
+        if not {"judul", "konten"}.issubset(df_chunk.columns):
+            print("⚠️ File tidak memiliki kolom 'judul' dan 'konten'. Proses dihentikan.")
+            return
+        lengths.extend(df_chunk["konten"].fillna("").astype(str).str.len().tolist())
+        if "dataset" in df_chunk.columns:
+            datasets.extend(df_chunk["dataset"].tolist())
+    total_rows = len(lengths)
+    print(f"📊 Total baris dalam dataset: {total_rows:,}")
+    print(f"🧠 Menggunakan {num_cores} core CPU, {NUM_PERM} permutasi, {NUM_BANDS} band")
+
+    signatures, valid = compute_signatures(input_file, total_rows, chunk_size, num_cores)
+    if keep == "longest":
+        pick_leader = lambda rows: max(rows, key=lambda row: (lengths[row], -row))
+    else:
+        pick_leader = min
+
+    clusters = []
+    for members in lsh_clusters(signatures, valid, threshold):
+        clusters.extend(split_by_leader(members, signatures, threshold, pick_leader))
+
+    drop_rows = set()
+    report_rows = []
+    for cluster_id, (kept, members) in enumerate(clusters, start=1):
+        for row in members:
+            if row != kept:
+                drop_rows.add(row)
+            report_rows.append({
+                "cluster_id": cluster_id,
+                "row": row,
+                "dataset": datasets[row] if datasets else "",
+                "kept": row == kept,
+                "similarity": float(np.mean(signatures[row] == signatures[kept])),
+            })
+
+    pd.DataFrame(
+        report_rows, columns=["cluster_id", "row", "dataset", "kept", "similarity"]
+    ).to_csv(report_file, index=False, encoding="utf-8")
+
+    is_first = True
+    start_row = 0
+    for df_chunk in pd.read_csv(input_file, chunksize=chunk_size, encoding="utf-8"):
+        rows = range(start_row, start_row + len(df_chunk))
+        mask = [row not in drop_rows for row in rows]
+        df_chunk[mask].to_csv(
+            output_file,
+            mode="w" if is_first else "a",
+            index=False,
+            header=is_first,
+            encoding="utf-8",
+        )
+        is_first = False
+        start_row += len(df_chunk)
+
+    print(f"✅ Ditemukan {len(clusters):,} cluster duplikat, {len(drop_rows):,} baris dihapus")
+    print(f"📁 Dataset tanpa duplikat: {output_file} ({total_rows - len(drop_rows):,} baris)")
+    print(f"📝 Laporan cluster: {report_file}")
+
+
+if __name__ == "__main__":
+    freeze_support()
+    step0_deduplication()
@@ -1,18 +1,16 @@
+import os
 import time
-from config.DataLoader import DataLoader
-from config.BowRepresentation import BowRepresentation
-from config.WhoosheIndexer import WhooshIndexer
-from config.Cosine import CosineRanker
+from config.IndexSnapshot import IndexSnapshot, SnapshotManager
 
 class IRSystemCLI:
     
     def __init__(self):
-        self.data_loader = DataLoader()
-        self.bow_model = BowRepresentation()
-        self.indexer = WhooshIndexer()
-        self.cosine_ranker = CosineRanker()
-        self.df = None
-        self.is_system_ready = False
+        # Komponen berat di-import saat snapshot dibangun agar menu langsung tampil
+        self.snapshots = SnapshotManager()
+    
+    @property
+    def is_system_ready(self):
+        return self.snapshots.current is not None
     
     def display_menu(self):
         """Display main menu"""
@@ -25,65 +23,131 @@ class IRSystemCLI:
         print("="*50)
         
         if self.is_system_ready:
-            print("✅ Status: Sistem siap untuk pencarian")
+            print(f"✅ Status: Sistem siap untuk pencarian (snapshot v{self.snapshots.current.version})")
         else:
             print("❌ Status: Silakan load dataset terlebih dahulu (Menu 1)")
+        
+        if self.snapshots.is_building:
+            print("🔄 Rebuild index sedang berjalan di background")
     
     def load_and_index_dataset(self):
         """Menu 1: Load & Index Dataset"""
         print("\n📂 LOAD & INDEX DATASET")
         print("-" * 30)
         
+        if self.snapshots.is_building:
+            print("❌ Rebuild index masih berjalan, tunggu hingga selesai!")
+            return False
+        
         file_path = input("Masukkan path file dataset (default: step_data\\step6_detokenized.csv): ").strip()
         if not file_path:
             file_path = r"step_data\step6_detokenized.csv"
         
-        print(f"\n🔄 Loading data dari: {file_path}")
-        start_time = time.time()
+        # Path dicek di sini agar kesalahan langsung terlihat, bukan dari thread background
+        if not os.path.exists(file_path):
+            print(f"❌ File tidak ditemukan di path: {file_path}")
+            return False
         
-        self.df = self.data_loader.load_processed_data(file_path)
+        # Reload saat sistem sudah siap: bangun di background tanpa progress, pencarian tetap jalan
+        if self.is_system_ready:
+            self.snapshots.build_in_background(self.build_snapshot, file_path, False)
+            print(f"🔄 Rebuild dimulai di background, pencarian tetap memakai snapshot v{self.snapshots.current.version}")
+            return True
         
-        if self.df is None:
-            print("❌ Gagal memuat data!")
+        snapshot = self.build_snapshot(file_path)
+        if snapshot is None:
             return False
         
-        load_time = time.time() - start_time
-        print(f"⏱️  Waktu loading data: {load_time:.2f} detik")
+        self.snapshots.publish(snapshot)
+        print("\n🎉 SISTEM BERHASIL DILOAD DAN SIAP DIGUNAKAN!")
+        
+        # Tampilkan contoh query yang bisa dicoba
+        print("\n💡 CONTOH QUERY YANG BISA DICOBA:")
+        print("   • 'drone militer afghanistan'")
+        print("   • 'apartemen jakarta harga'")
+        print("   • 'teknologi artificial intelligence'")
+        print("   • 'presiden obama'")
+        print("   • 'pendidikan tinggi'")
+        
+        return True
+    
+    def build_snapshot(self, file_path: str, verbose: bool = True):
+        """Load data dan bangun semua komponen index menjadi satu snapshot baru.
         
-        print("\n🔄 Membuat Bag of Words representation...")
+        verbose=False dipakai untuk rebuild di background agar progress tidak
+        tercampur dengan menu; error tetap dicetak.
+        """
+        from config.DataLoader import DataLoader
+        from config.BowRepresentation import BowRepresentation
+        from config.WhoosheIndexer import WhooshIndexer
+        from config.Cosine import CosineRanker
+        from config.QueryCorrector import QueryCorrector
+        
+        version = self.snapshots.next_version()
+        bow_model = BowRepresentation()
+        indexer = WhooshIndexer(index_dir=self.snapshots.create_index_dir(version))
+        cosine_ranker = CosineRanker()
+        query_corrector = QueryCorrector()
+        
+        if verbose:
+            print(f"\n🔄 Loading data dari: {file_path}")
+        start_time = time.time()
+        
+        df = DataLoader().load_processed_data(file_path, verbose)
+        
+        if df is None:
+            print("❌ Gagal memuat data!")
+            return None
+        
+        if verbose:
+            load_time = time.time() - start_time
+            print(f"⏱️  Waktu loading data: {load_time:.2f} detik")
+            print("\n🔄 Membuat Bag of Words representation...")
         bow_start = time.time()
-        documents_text = self.df['full_text'].tolist()
-        bow_matrix = self.bow_model.create_bow(documents_text)
+        documents_text = df['full_text'].tolist()
+        bow_matrix = bow_model.create_bow(documents_text, verbose)
         bow_time = time.time() - bow_start
         
         if bow_matrix is None:
             print("❌ Gagal membuat BoW representation!")
-            return False
+            return None
         
-        print(f"⏱️  Waktu membuat BoW: {bow_time:.2f} detik")
+        if verbose:
+            print(f"⏱️  Waktu membuat BoW: {bow_time:.2f} detik")
+            print("\n🔄 Menyiapkan koreksi query...")
+        corrector_start = time.time()
+        corrector_path = os.path.splitext(file_path)[0] + "_symspell.pkl"
+        query_corrector.build_or_load(bow_model, corrector_path, verbose)
         
-        print("\n🔄 Membangun Whoosh index...")
+        if verbose:
+            print(f"⏱️  Waktu koreksi query: {time.time() - corrector_start:.2f} detik")
+            print("\n🔄 Membangun Whoosh index...")
         index_start = time.time()
-        ix = self.indexer.build_index(self.df)
+        ix = indexer.build_index(df, verbose)
         index_time = time.time() - index_start
         
         if ix is None:
             print("❌ Gagal membangun Whoosh index!")
-            return False
+            return None
         
-        print(f"⏱️  Waktu membangun index: {index_time:.2f} detik")
+        if verbose:
+            print(f"⏱️  Waktu membangun index: {index_time:.2f} detik")
+            print("\n🔄 Menginisialisasi Cosine Ranker...")
+        cosine_ranker.initialize(bow_model, df, verbose)
         
-        print("\n🔄 Menginisialisasi Cosine Ranker...")
-        self.cosine_ranker.initialize(self.bow_model, self.df)
+        snapshot = IndexSnapshot(version, df, bow_model, indexer, cosine_ranker, query_corrector)
+        if not verbose:
+            return snapshot
         
         total_time = time.time() - start_time
         print(f"\n⏱️  TOTAL WAKTU: {total_time:.2f} detik")
         
         print("\n📈 SYSTEM PERFORMANCE SUMMARY")
         print("=" * 40)
-        print(f"✅ Total Documents: {len(self.df):,}")
-        if self.bow_model.feature_names is not None:
-            print(f"✅ Vocabulary Size: {len(self.bow_model.feature_names):,}")
+        print(f"✅ Snapshot: v{version}")
+        print(f"✅ Total Documents: {len(df):,}")
+        if bow_model.feature_names is not None:
+            print(f"✅ Vocabulary Size: {len(bow_model.feature_names):,}")
         print(f"✅ BoW Matrix: {bow_matrix.shape} (docs x features)")
         
         # Check memory usage
@@ -91,18 +155,23 @@ class IRSystemCLI:
             bow_size = (bow_matrix.data.nbytes + bow_matrix.indptr.nbytes + bow_matrix.indices.nbytes) / (1024 * 1024)
             print(f"✅ BoW Memory: {bow_size:.2f} MB")
         
-        self.is_system_ready = True
-        print("\n🎉 SISTEM BERHASIL DILOAD DAN SIAP DIGUNAKAN!")
+        return snapshot
+    
+    def correct_query(self, snapshot: IndexSnapshot, query: str) -> str:
+        """Koreksi kata di luar vocabulary, sisa query tetap seperti yang diketik"""
+        if snapshot.query_corrector is None or not snapshot.query_corrector.is_built:
+            return query
         
-        # Tampilkan contoh query yang bisa dicoba
-        print("\n💡 CONTOH QUERY YANG BISA DICOBA:")
-        print("   • 'drone militer afghanistan'")
-        print("   • 'apartemen jakarta harga'")
-        print("   • 'teknologi artificial intelligence'")
-        print("   • 'presiden obama'")
-        print("   • 'pendidikan tinggi'")
+        try:
+            corrected, corrections = snapshot.query_corrector.correct_query(query)
+        except Exception as e:
+            print(f"⚠️ Koreksi query dilewati: {e}")
+            return query
         
-        return True
+        for c in corrections:
+            print(f"🔤 '{c['term']}' → '{c['correction']}' (jarak {c['distance']})")
+        
+        return corrected
     
     def ask_show_content(self):
         """Tanya user apakah ingin menampilkan konten"""
@@ -148,9 +217,6 @@ class IRSystemCLI:
             print("❌ Query tidak boleh kosong!")
             return
         
-        print(f"\nMencari: '{query}'")
-        print("-" * 50)
-        
         # Tanya apakah ingin menampilkan konten
         show_content = self.ask_show_content()
         
@@ -165,31 +231,34 @@ class IRSystemCLI:
             print("❌ Pilihan tidak valid!")
             return
         
-        search_start = time.time()
-        
-        if choice == 1:
-            self._whoosh_search(query, show_content)
-        elif choice == 2:
-            self._cosine_search(query, show_content)
-        elif choice == 3:
-            self._hybrid_search(query, show_content)
-        else:
+        searches = {1: self._whoosh_search, 2: self._cosine_search, 3: self._hybrid_search}
+        if choice not in searches:
             print("❌ Pilihan tidak valid!")
             return
         
+        search_start = time.time()
+        
+        # Snapshot hanya dipegang selama koreksi & pencarian, bukan selama menunggu input
+        with self.snapshots.acquire() as snapshot:
+            query = self.correct_query(snapshot, query)
+            print(f"\nMencari: '{query}' (snapshot v{snapshot.version})")
+            print("-" * 50)
+            searches[choice](snapshot, query, show_content)
+        
         search_time = time.time() - search_start
         print(f"\n⏱️  Waktu pencarian: {search_time:.2f} detik")
     
-    def _whoosh_search(self, query: str, show_content: bool = False):
+    def _whoosh_search(self, snapshot: IndexSnapshot, query: str, show_content: bool = False):
         """Whoosh search only - FIXED VERSION"""
         try:
-            results = self.indexer.search(query, limit=5)
+            hits = snapshot.indexer.search(query, limit=5)
             
-            print(f"\n🔍 WHOOSH SEARCH RESULTS ({len(results)} documents):")
-            if len(results) == 0:
+            print(f"\n🔍 WHOOSH SEARCH RESULTS ({len(hits)} documents):")
+            if len(hits) == 0:
                 print("   Tidak ada hasil yang ditemukan")
                 return
             
+            results = snapshot.indexer.fetch_documents(hits)
             self.display_search_results(results, show_content)
                 
         except Exception as e:
@@ -197,10 +266,10 @@ class IRSystemCLI:
             import traceback
             traceback.print_exc()
     
-    def _cosine_search(self, query: str, show_content: bool = False):
+    def _cosine_search(self, snapshot: IndexSnapshot, query: str, show_content: bool = False):
         """Cosine similarity search only"""
         try:
-            results = self.cosine_ranker.rank_documents(query, top_k=5)
+            results = snapshot.cosine_ranker.rank_documents(query, top_k=5)
             
             print(f"\n📊 COSINE SIMILARITY RESULTS ({len(results)} documents):")
             if len(results) == 0:
@@ -212,18 +281,18 @@ class IRSystemCLI:
         except Exception as e:
             print(f"❌ Error dalam Cosine search: {e}")
     
-    def _hybrid_search(self, query: str, show_content: bool = False):
+    def _hybrid_search(self, snapshot: IndexSnapshot, query: str, show_content: bool = False):
         """Hybrid search - FIXED VERSION"""
         try:
             print("🔍 Mencari dengan Whoosh...")
-            whoosh_results = self.indexer.search(query, limit=10)
+            whoosh_results = snapshot.indexer.search(query, limit=10)
             
             if not whoosh_results:
                 print("❌ Whoosh tidak menemukan hasil, hybrid search dibatalkan")
                 return
             
             print("📊 Menghitung cosine similarity...")
-            hybrid_results = self.cosine_ranker.hybrid_search(whoosh_results, query, top_k=5)
+            hybrid_results = snapshot.cosine_ranker.hybrid_search(whoosh_results, query, top_k=5)
             
             print(f"\n🎯 HYBRID SEARCH RESULTS ({len(hybrid_results)} documents):")
             if len(hybrid_results) == 0:
@@ -271,10 +340,17 @@ class IRSystemCLI:
                 self.search_query()
             elif choice == 3:
                 print("\n👋 Terima kasih telah menggunakan Information Retrieval System!")
+                self.close()
                 break
             else:
                 print("❌ Pilihan tidak valid! Silakan pilih 1-3.")
 
+    def close(self):
+        """Tunggu rebuild yang berjalan dan tutup snapshot aktif"""
+        if self.snapshots.is_building:
+            print("⏳ Menunggu rebuild index selesai...")
+        self.snapshots.close()
+
 def main():
     """Main function"""
     system = IRSystemCLI()